@@ -32,11 +32,21 @@ class ElevenLabsExample(VoiceoverScene):
                     style=0.0,
                     use_speaker_boost=True
                 ),
-                output_format="mp3_44100_128",  # High quality format
+                output_format="mp3_44100_128",  # High quality format, or "pcm_24000" for lower latency
                 enable_logging=True,  # Enable for history features
             )
         )
-        
+
+        # Optionally start synthesizing upcoming voiceovers in the background
+        # while the scene is being animated
+        self.prefetch_voiceovers(
+            [
+                "This circle is drawn as I speak.",
+                "Let's shift it to the left 2 units.",
+                "Thank you for watching.",
+            ]
+        )
+
         circle = Circle()
         square = Square().shift(2 * RIGHT)
 
@@ -57,6 +67,7 @@ class ElevenLabsExample(VoiceoverScene):
                 use_speaker_boost=False
             ),
             optimize_streaming_latency=3,  # Max latency optimization for this request
+            apply_text_normalization="off",  # Skip text normalization for this request
         ) as tracker:
             self.play(Transform(circle, square), run_time=tracker.duration)
 
@@ -3,6 +3,7 @@ import json
 import re
 import os
 import sys
+import threading
 from typing import Union
 import pip
 import textwrap
@@ -17,8 +18,14 @@ def chunks(lst: list, n: int):
         yield lst[i : i + n]
 
 
+BOOKMARK_PATTERN = re.compile(r"<bookmark\s*mark\s*=['\"]\w*[\"']\s*/>")
+
+
 def remove_bookmarks(input: str) -> str:
-    return re.sub("<bookmark\s*mark\s*=['\"]\w*[\"']\s*/>", "", input)
+    # Most texts have no bookmarks, so skip the regex engine for those
+    if "<bookmark" not in input:
+        return input
+    return BOOKMARK_PATTERN.sub("", input)
 
 
 def wav2mp3(wav_path, mp3_path=None, remove_wav=True, bitrate="312k"):
@@ -100,11 +107,19 @@ def trim_silence(
     return trimmed_sound
 
 
+def _dump_json_atomically(json_file: str, json_data):
+    # Write to a temporary file and swap it in, so that readers on other
+    # threads (e.g. prefetched voiceovers) never see a truncated file
+    tmp_file = f"{json_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_file, "w") as f:
+        json.dump(json_data, f, indent=2)
+    os.replace(tmp_file, json_file)
+
+
 def append_to_json_file(json_file: str, data: dict):
     """Append data to json file"""
     if not os.path.exists(json_file):
-        with open(json_file, "w") as f:
-            json.dump([data], f, indent=2)
+        _dump_json_atomically(json_file, [data])
         return
 
     with open(json_file, "r") as f:
@@ -114,8 +129,7 @@ def append_to_json_file(json_file: str, data: dict):
         raise ValueError("JSON file should be a list")
 
     json_data.append(data)
-    with open(json_file, "w") as f:
-        json.dump(json_data, f, indent=2)
+    _dump_json_atomically(json_file, json_data)
     return
 
 
@@ -1,6 +1,7 @@
 import os
 import sox
 import uuid
+import wave
 from mutagen.mp3 import MP3
 
 
@@ -19,6 +20,9 @@ def adjust_speed(input_path: str, output_path: str, tempo: float) -> None:
 
 
 def get_duration(path: str) -> float:
+    if str(path).lower().endswith(".wav"):
+        with wave.open(str(path), "rb") as audio:
+            return audio.getnframes() / audio.getframerate()
     audio = MP3(path)
     return audio.info.length
     # return sox.file_info.duration(path)
@@ -1,7 +1,31 @@
+import asyncio
+import base64
+import hashlib
+import importlib.util
+import json
 import os
+import random
+import re
 import sys
+import time
+import uuid
+import wave
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+from urllib.parse import urlencode
 
 from dotenv import find_dotenv, load_dotenv
 from manim import logger
@@ -10,8 +34,11 @@ from manim_voiceover_fixed.helper import create_dotenv_file, remove_bookmarks
 from manim_voiceover_fixed.services.base import SpeechService
 
 try:
-    from elevenlabs.client import ElevenLabs
-    from elevenlabs import VoiceSettings, save
+    import httpx
+    from elevenlabs.client import AsyncElevenLabs, ElevenLabs
+    from elevenlabs import VoiceSettings
+    from elevenlabs.core.api_error import ApiError
+    from websockets.sync.client import connect as websocket_connect
 except ImportError:
     logger.error(
         'Missing packages. Run `pip install "manim-voiceover[elevenlabs]"` '
@@ -19,17 +46,12 @@ except ImportError:
     )
 
 
-load_dotenv(find_dotenv(usecwd=True))
-
-
 def create_dotenv_elevenlabs():
     logger.info(
         "Check out https://voiceover.manim.community/en/stable/services.html#elevenlabs"
         " to learn how to create an account and get your subscription key."
     )
-    try:
-        os.environ["ELEVEN_API_KEY"]
-    except KeyError:
+    if os.environ.get("ELEVEN_API_KEY") is None:
         if not create_dotenv_file(["ELEVEN_API_KEY"]):
             raise Exception(
                 "The environment variables ELEVEN_API_KEY are not set. "
@@ -39,7 +61,167 @@ def create_dotenv_elevenlabs():
         sys.exit()
 
 
-create_dotenv_elevenlabs()
+_env_loaded = False
+
+
+def _load_env() -> None:
+    # Done on first use rather than at import time, so that importing this
+    # module neither searches the filesystem nor exits the process
+    global _env_loaded
+    if _env_loaded:
+        return
+    load_dotenv(find_dotenv(usecwd=True))
+    create_dotenv_elevenlabs()
+    _env_loaded = True
+
+
+# Clients are shared across service instances so that the underlying HTTPS
+# connection pool (and its TLS sessions) is reused between scenes.
+_CLIENT_CACHE: Dict[Optional[str], "ElevenLabs"] = {}
+
+# A forked child must not reuse the parent's open connections
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_CLIENT_CACHE.clear)
+
+
+def _get_client(api_key: Optional[str]) -> "ElevenLabs":
+    client = _CLIENT_CACHE.get(api_key)
+    if client is None:
+        httpx_client = httpx.Client(
+            # HTTP/2 requires the optional `h2` package
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=60.0),
+            timeout=240.0,
+        )
+        client = ElevenLabs(api_key=api_key, httpx_client=httpx_client)
+        _CLIENT_CACHE[api_key] = client
+    return client
+
+
+_MAX_ATTEMPTS = 5
+_MAX_BACKOFF = 10.0
+
+T = TypeVar("T")
+
+
+def _retriable(e: Exception) -> bool:
+    # Rate limits, server errors and network failures are worth retrying,
+    # while other client errors (bad key, unknown voice, ...) are not
+    if isinstance(e, ApiError):
+        return e.status_code is not None and (
+            e.status_code == 429 or e.status_code >= 500
+        )
+    return isinstance(e, (httpx.TransportError, TimeoutError))
+
+
+def _backoff(attempt: int, e: Exception) -> float:
+    delay = min(2**attempt + random.random(), _MAX_BACKOFF)
+    logger.warning(
+        f"ElevenLabs request failed ({e}), retrying in {delay:.1f}s "
+        f"({attempt + 1}/{_MAX_ATTEMPTS - 1})."
+    )
+    return delay
+
+
+def _with_retries(fn: Callable[[], T]) -> T:
+    # The same client is used for every attempt, so that retries keep the
+    # warm connection pool instead of paying for new handshakes
+    for attempt in range(_MAX_ATTEMPTS):
+        try:
+            return fn()
+        except Exception as e:
+            if attempt == _MAX_ATTEMPTS - 1 or not _retriable(e):
+                raise
+            time.sleep(_backoff(attempt, e))
+
+
+async def _async_with_retries(fn: Callable[[], Awaitable[T]]) -> T:
+    for attempt in range(_MAX_ATTEMPTS):
+        try:
+            return await fn()
+        except Exception as e:
+            if attempt == _MAX_ATTEMPTS - 1 or not _retriable(e):
+                raise
+            await asyncio.sleep(_backoff(attempt, e))
+
+
+@asynccontextmanager
+async def _open_async_client(api_key: Optional[str]) -> AsyncIterator["AsyncElevenLabs"]:
+    # Async connection pools belong to the event loop they were created in,
+    # so they are opened and closed within one batch instead of being cached
+    async with httpx.AsyncClient(
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=60.0),
+        timeout=240.0,
+    ) as httpx_client:
+        yield AsyncElevenLabs(api_key=api_key, httpx_client=httpx_client)
+
+
+# Voices available to each API key, cached so that every new service does not
+# need to query the API again. Each entry holds the fetch time, the voice list
+# and the voices indexed by name and by id.
+_VOICES_CACHE: Dict[Optional[str], Tuple[float, list, dict, dict]] = {}
+_VOICES_CACHE_TTL = 600.0
+
+
+_STREAM_INPUT_URL = "wss://api.elevenlabs.io/v1/text-to-speech/{voice_id}/stream-input"
+DEFAULT_CHUNK_SCHEDULE = [50, 120, 160, 290]
+
+
+# Streamed audio arrives in small chunks, so writes are buffered to save syscalls
+_WRITE_BUFFER_SIZE = 64 * 1024
+
+
+# Texts longer than this are synthesized sentence by sentence
+SENTENCE_SPLIT_MIN_LENGTH = 200
+_SENTENCE_MIN_LENGTH = 10
+_ABBREVIATIONS = ("Mr.", "Mrs.", "Ms.", "Dr.", "Prof.", "St.", "vs.", "etc.", "e.g.", "i.e.")
+
+
+def _split_sentences(text: str) -> List[str]:
+    sentences: List[str] = []
+    # Sentence ends are punctuation followed by whitespace and a capital
+    # letter, which leaves decimals such as 3.14 intact
+    for piece in re.split(r"(?<=[.!?])\s+(?=[A-Z])", text):
+        if sentences and (
+            sentences[-1].endswith(_ABBREVIATIONS)
+            or len(sentences[-1]) < _SENTENCE_MIN_LENGTH
+        ):
+            sentences[-1] += " " + piece
+        else:
+            sentences.append(piece)
+    # A short trailing sentence is merged into the previous one as well
+    if len(sentences) > 1 and len(sentences[-1]) < _SENTENCE_MIN_LENGTH:
+        last = sentences.pop()
+        sentences[-1] += " " + last
+    return sentences
+
+
+def _split_at_word_boundaries(text_iter: Iterable[str]) -> Iterator[str]:
+    # The input streaming API expects every chunk to end with a space, so
+    # partial words (e.g. LLM tokens) are held back until they are complete
+    buffer = ""
+    for text in text_iter:
+        buffer += re.sub(r"\s+", " ", text)
+        head, sep, buffer = buffer.rpartition(" ")
+        if head.strip():
+            yield head.strip() + " "
+    if buffer.strip():
+        yield buffer.strip() + " "
+
+
+def _parse_stream_message(message) -> Tuple[bytes, bool]:
+    data = json.loads(message)
+    if data.get("error"):
+        raise Exception(f"ElevenLabs input streaming failed: {data}")
+    audio = base64.b64decode(data["audio"]) if data.get("audio") else b""
+    return audio, bool(data.get("isFinal"))
+
+
+def _validate_language_code(language_code: Optional[str], model: str) -> None:
+    if language_code:
+        if model not in ["eleven_turbo_v2_5", "eleven_flash_v2_5"]:
+            raise Exception(f"Language code {language_code} is not supported for model {model}. Needs model to be one of ['eleven_turbo_v2_5', 'eleven_flash_v2_5']")
 
 
 class ElevenLabsService(SpeechService):
@@ -57,6 +239,7 @@ class ElevenLabsService(SpeechService):
         language_code: Optional[str] = None,
         apply_text_normalization: Optional[str] = None,
         apply_language_text_normalization: Optional[bool] = None,
+        chunk_schedule: Optional[List[int]] = None,
         transcription_model: str = "base",
         **kwargs,
     ):
@@ -73,6 +256,8 @@ class ElevenLabsService(SpeechService):
                 `API page <https://elevenlabs.io/docs/api-reference/text-to-speech>`
                 for reference. Defaults to `None`. If none of `voice_name`
                 or `voice_id` must be provided, it uses default available voice.
+                If only `voice_id` is given, the voice is not looked up and
+                the id is also used as `voice_name`, including in the cache.
             model (str, optional): The name of the model to use. See the `API
                 page: <https://elevenlabs.io/docs/api-reference/text-to-speech>`
                 for reference. Defaults to `eleven_multilingual_v2`
@@ -86,6 +271,11 @@ class ElevenLabsService(SpeechService):
                 See the `API page:
                 <https://elevenlabs.io/docs/api-reference/text-to-speech>`
                 for reference. Defaults to `mp3_44100_128`.
+                PCM formats such as `pcm_24000` skip the MP3 encoding on
+                ElevenLabs' side and are saved as 16-bit mono `.wav` files.
+                The sample rate in the format name is written to the wav
+                header, so it has to match the rate the audio was
+                generated at, which ElevenLabs guarantees.
             enable_logging (bool, optional): When enable_logging is set to false 
                 zero retention mode will be used for the request. Defaults to None.
             optimize_streaming_latency (int, optional): You can turn on latency 
@@ -98,33 +288,139 @@ class ElevenLabsService(SpeechService):
             apply_language_text_normalization (bool, optional): Controls language 
                 text normalization. Can heavily increase latency. Currently only 
                 supported for Japanese. Defaults to None.
+            chunk_schedule (List[int], optional): The number of characters
+                ElevenLabs buffers before generating each audio chunk when
+                using :meth:`generate_from_text_stream`. Lower values give
+                faster first audio at some cost of quality. Defaults to
+                `[50, 120, 160, 290]`.
         """
-        # Initialize the ElevenLabs client
+        _load_env()
+
+        # Reuse the ElevenLabs client (and its connection pool) for this key
         api_key = os.getenv("ELEVEN_API_KEY")
-        self.client = ElevenLabs(api_key=api_key)
+        self._api_key = api_key
+        self.client = _get_client(api_key)
         
         # Initialize consecutive text tracking dictionary
         self.consecutive_text_by_id: Dict[str, str] = {}
+
+        # Worker pool for synthesizing upcoming voiceovers in the background
+        self._executor = ThreadPoolExecutor(max_workers=3)
+        self._prefetched: Dict[str, Future] = {}
+        # Separate pool for the sentences of long texts, so that prefetched
+        # voiceovers waiting on their sentences cannot starve each other
+        self._sentence_executor = ThreadPoolExecutor(max_workers=3)
+
+        _validate_language_code(language_code, model)
+
+        self._requested_voice_name = voice_name
+        self._requested_voice_id = voice_id
+        self._voice_future: Optional[Future] = None
+        # Hash of the default config, computed on first use since it depends
+        # on the resolved voice
+        self._config_key_prefix: Optional[str] = None
+        if voice_id and not voice_name:
+            # The id is all the API needs, so there is nothing to look up.
+            # The name is part of the cache key, so it is set to the id
+            # rather than to a name that would need the lookup.
+            self.voice_id = voice_id
+            self.voice_name = voice_id
+            self._voice_resolved = True
+        else:
+            # Look the voice up in the background while the scene is being
+            # constructed, and only wait for it on the first generation
+            self._voice_resolved = False
+            self._voice_future = self._executor.submit(self._resolve_voice)
+
+        self.model = model
         
-        if not voice_name and not voice_id:
-            logger.warn(
-                "None of `voice_name` or `voice_id` provided. "
-                "Will be using default voice."
-            )
+        # Store voice_settings directly
+        self.voice_settings = voice_settings
+            
+        self.output_format = output_format
+        self.enable_logging = enable_logging
+        self.optimize_streaming_latency = optimize_streaming_latency
+        self.language_code = language_code
+        self.apply_text_normalization = apply_text_normalization
+        self.apply_language_text_normalization = apply_language_text_normalization
+        self.chunk_schedule = chunk_schedule or DEFAULT_CHUNK_SCHEDULE
+
+        SpeechService.__init__(self, transcription_model=transcription_model, **kwargs)
+
+    def __getstate__(self) -> dict:
+        # The client, thread pools and futures cannot be pickled, e.g. to send
+        # the service to worker processes. They are recreated on unpickling.
+        state = self.__dict__.copy()
+        for key in (
+            "client",
+            "_api_key",
+            "_executor",
+            "_sentence_executor",
+            "_prefetched",
+            "_voice_future",
+        ):
+            state.pop(key, None)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        _load_env()
+        self._api_key = os.getenv("ELEVEN_API_KEY")
+        self.client = _get_client(self._api_key)
+        self._executor = ThreadPoolExecutor(max_workers=3)
+        self._sentence_executor = ThreadPoolExecutor(max_workers=3)
+        self._prefetched = {}
+        self._voice_future = None
+        if not self._voice_resolved:
+            self._voice_future = self._executor.submit(self._resolve_voice)
+
+    def _get_voices(self) -> Tuple[list, dict, dict]:
+        cached = _VOICES_CACHE.get(self._api_key)
+        if cached is not None and time.monotonic() - cached[0] < _VOICES_CACHE_TTL:
+            return cached[1:]
 
-        # Get available voices using the new API
         try:
-            voices_response = self.client.voices.get_all()
+            voices_response = _with_retries(self.client.voices.get_all)
             available_voices = voices_response.voices
         except Exception as e:
             logger.error(f"Failed to get voices: {e}")
             raise Exception("Failed to get voices from ElevenLabs API.")
 
+        # Built in reverse so that the first voice wins for duplicate names
+        by_name = {v.name: v for v in reversed(available_voices)}
+        by_id = {v.voice_id: v for v in available_voices}
+        _VOICES_CACHE[self._api_key] = (
+            time.monotonic(),
+            available_voices,
+            by_name,
+            by_id,
+        )
+        return available_voices, by_name, by_id
+
+    def _resolve_voice(self) -> None:
+        self._select_voice(self._requested_voice_name, self._requested_voice_id)
+
+    def _ensure_voice(self) -> None:
+        if not self._voice_resolved:
+            self._voice_future.result()
+            self._voice_resolved = True
+
+    def _select_voice(
+        self, voice_name: Optional[str], voice_id: Optional[str]
+    ) -> None:
+        if not voice_name and not voice_id:
+            logger.warn(
+                "None of `voice_name` or `voice_id` provided. "
+                "Will be using default voice."
+            )
+
+        available_voices, by_name, by_id = self._get_voices()
+
         selected_voice = None
         if voice_name:
-            selected_voice = next((v for v in available_voices if v.name == voice_name), None)
+            selected_voice = by_name.get(voice_name)
         elif voice_id:
-            selected_voice = next((v for v in available_voices if v.voice_id == voice_id), None)
+            selected_voice = by_id.get(voice_id)
 
         if selected_voice:
             self.voice_id = selected_voice.voice_id
@@ -139,31 +435,441 @@ class ElevenLabsService(SpeechService):
                 self.voice_name = available_voices[0].name
             else:
                 raise Exception("No voices available from ElevenLabs API.")
-            
-        # validate language_code
-        if language_code:
-            if model not in ["eleven_turbo_v2_5", "eleven_flash_v2_5"]:
-                raise Exception(f"Language code {language_code} is not supported for model {model}. Needs model to be one of ['eleven_turbo_v2_5', 'eleven_flash_v2_5']")
 
-        self.model = model
-        
-        # Store voice_settings directly
-        self.voice_settings = voice_settings
-            
-        self.output_format = output_format
-        self.enable_logging = enable_logging
-        self.optimize_streaming_latency = optimize_streaming_latency
-        self.language_code = language_code
-        self.apply_text_normalization = apply_text_normalization
-        self.apply_language_text_normalization = apply_language_text_normalization
+    @staticmethod
+    def _prefetch_key(text: str, cache_dir, path, kwargs: dict) -> str:
+        return repr((text, str(cache_dir), path, sorted(kwargs.items())))
 
-        SpeechService.__init__(self, transcription_model=transcription_model, **kwargs)
+    @staticmethod
+    def _config_key(input_data: dict) -> str:
+        dumped_config = json.dumps(
+            {"service": input_data["service"], "config": input_data["config"]},
+            sort_keys=True,
+        )
+        return hashlib.sha256(dumped_config.encode("utf-8")).hexdigest()[:16]
+
+    def _cache_key(self, input_data: dict, default_config: bool = False) -> str:
+        # The key is the hash of the config followed by the hash of the text.
+        # Most voiceovers use the service's default config, whose hash is
+        # computed once and reused, so only the text needs hashing.
+        if default_config:
+            if self._config_key_prefix is None:
+                self._config_key_prefix = self._config_key(input_data)
+            config_key = self._config_key_prefix
+        else:
+            config_key = self._config_key(input_data)
+        text_key = hashlib.sha256(input_data["input_text"].encode("utf-8")).hexdigest()[:16]
+        return config_key + "_" + text_key
+
+    def _audio_extension(self) -> str:
+        if self.output_format.startswith("pcm_"):
+            return ".wav"
+        return ".mp3"
+
+    @contextmanager
+    def _open_audio_file(self, full_audio_path: Path) -> Iterator[Callable[[bytes], None]]:
+        # Write to a temporary file first so that an interrupted download
+        # never leaves a truncated file behind under the cached name. The name
+        # is unique, as the same file can be written concurrently (e.g. by
+        # the async path or by several processes sharing the cache).
+        tmp_audio_path = full_audio_path.with_name(
+            f"{full_audio_path.name}.{uuid.uuid4().hex}.part"
+        )
+        try:
+            with open(tmp_audio_path, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+                if self.output_format.startswith("pcm_"):
+                    # Raw 16-bit mono PCM, wrapped in a wav container
+                    sample_rate = int(self.output_format.split("_")[1])
+                    with wave.open(f, "wb") as wav_file:
+                        wav_file.setnchannels(1)
+                        wav_file.setsampwidth(2)
+                        wav_file.setframerate(sample_rate)
+                        yield wav_file.writeframesraw
+                else:
+                    yield f.write
+        except BaseException:
+            if os.path.exists(tmp_audio_path):
+                os.remove(tmp_audio_path)
+            raise
+        os.replace(tmp_audio_path, full_audio_path)
+
+    def _write_audio(self, audio: Iterable[bytes], full_audio_path: Path) -> None:
+        with self._open_audio_file(full_audio_path) as write:
+            for chunk in audio:
+                if chunk:
+                    write(chunk)
+
+    def _stream_input(
+        self, text_iter: Iterable[str], sent_text: List[str]
+    ) -> Iterator[bytes]:
+        params = {
+            "model_id": self.model,
+            "output_format": self.output_format,
+            "enable_logging": self.enable_logging,
+            "optimize_streaming_latency": self.optimize_streaming_latency,
+            "language_code": self.language_code,
+            "apply_text_normalization": self.apply_text_normalization,
+        }
+        query = urlencode(
+            {
+                k: str(v).lower() if isinstance(v, bool) else v
+                for k, v in params.items()
+                if v is not None
+            }
+        )
+        url = _STREAM_INPUT_URL.format(voice_id=self.voice_id) + "?" + query
+
+        with websocket_connect(
+            url, additional_headers={"xi-api-key": self._api_key}
+        ) as socket:
+            init_message = {
+                "text": " ",
+                "generation_config": {"chunk_length_schedule": self.chunk_schedule},
+            }
+            if self.voice_settings:
+                init_message["voice_settings"] = self.voice_settings.model_dump(
+                    exclude_none=True
+                )
+            socket.send(json.dumps(init_message))
+
+            for text_chunk in _split_at_word_boundaries(text_iter):
+                sent_text.append(text_chunk)
+                socket.send(json.dumps({"text": text_chunk}))
+                # Pass on whatever audio is already available without waiting
+                while True:
+                    try:
+                        audio, _ = _parse_stream_message(socket.recv(timeout=0))
+                    except TimeoutError:
+                        break
+                    yield audio
+
+            # An empty text closes the input and flushes the remaining audio
+            socket.send(json.dumps({"text": ""}))
+            while True:
+                audio, is_final = _parse_stream_message(socket.recv())
+                yield audio
+                if is_final:
+                    break
+
+    def generate_from_text_stream(
+        self,
+        text_iter: Iterable[str],
+        cache_dir: Optional[str] = None,
+    ) -> dict:
+        """Synthesizes speech from text that is still being produced, e.g. by
+        an LLM, using the ElevenLabs WebSocket input streaming API. Audio
+        generation starts as soon as the first words arrive, instead of after
+        the whole text is known. Bookmarks are not supported.
+
+        Args:
+            text_iter (Iterable[str]): The pieces of text to synthesize, in order.
+            cache_dir (str, optional): The output directory. Defaults to None.
+
+        Returns:
+            dict: Output data dictionary.
+        """
+        if cache_dir is None:
+            cache_dir = self.cache_dir  # type: ignore
+
+        self._ensure_voice()
+
+        # The file is named after its input, which is only known at the end
+        sent_text: List[str] = []
+        stream_audio_path = Path(cache_dir) / (
+            "stream-" + uuid.uuid4().hex + self._audio_extension()
+        )
+        try:
+            self._write_audio(
+                self._stream_input(text_iter, sent_text), stream_audio_path
+            )
+        except Exception as e:
+            logger.error(f"ElevenLabs TTS failed: {e}")
+            raise Exception(f"Failed to generate speech: {e}")
+
+        input_text = " ".join("".join(sent_text).split())
+        if not input_text:
+            os.remove(stream_audio_path)
+            raise ValueError("No text was received to synthesize.")
+
+        input_data = {
+            "input_text": input_text,
+            "service": "elevenlabs",
+            "config": {
+                "model": self.model,
+                "voice_id": self.voice_id,
+                "voice_name": self.voice_name,
+                "voice_settings": self.voice_settings.model_dump()
+                if self.voice_settings
+                else None,
+                "output_format": self.output_format,
+                "enable_logging": self.enable_logging,
+                "optimize_streaming_latency": self.optimize_streaming_latency,
+                "language_code": self.language_code,
+                "apply_text_normalization": self.apply_text_normalization,
+                "chunk_schedule": self.chunk_schedule,
+            },
+        }
+        audio_path = self._cache_key(input_data) + self._audio_extension()
+        os.replace(stream_audio_path, Path(cache_dir) / audio_path)
+
+        return {
+            "input_text": input_text,
+            "input_data": input_data,
+            "original_audio": audio_path,
+        }
+
+    def _synthesize(self, text: str, **kwargs) -> Iterator[bytes]:
+        # Stream the audio so that chunks are written to disk as soon as
+        # they are synthesized, instead of waiting for the full clip
+        return self.client.text_to_speech.stream(
+            text=text,
+            voice_id=self.voice_id,
+            model_id=self.model,
+            output_format=self.output_format,
+            **kwargs,
+        )
+
+    def _synthesize_bytes(self, text: str, **kwargs) -> bytes:
+        return _with_retries(lambda: b"".join(self._synthesize(text, **kwargs)))
+
+    def _synthesize_sentences(
+        self,
+        sentences: List[str],
+        previous_text: Optional[str] = None,
+        next_text: Optional[str] = None,
+        previous_request_ids: Optional[List[str]] = None,
+        next_request_ids: Optional[List[str]] = None,
+        **kwargs,
+    ) -> Iterator[bytes]:
+        # Synthesize all sentences in parallel and yield them in order, so the
+        # first sentence is written while the others are still generating.
+        # The surrounding sentences are passed as context to keep the prosody
+        # of the concatenated audio consistent.
+        futures = []
+        for i, sentence in enumerate(sentences):
+            context_before = " ".join(filter(None, [previous_text, *sentences[:i]]))
+            context_after = " ".join(filter(None, [*sentences[i + 1 :], next_text]))
+            futures.append(
+                self._sentence_executor.submit(
+                    self._synthesize_bytes,
+                    sentence,
+                    previous_text=context_before or None,
+                    next_text=context_after or None,
+                    previous_request_ids=previous_request_ids if i == 0 else None,
+                    next_request_ids=next_request_ids
+                    if i == len(sentences) - 1
+                    else None,
+                    **kwargs,
+                )
+            )
+
+        try:
+            for future in futures:
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def generate_from_text_async(
+        self,
+        text: str,
+        cache_dir: Optional[str] = None,
+        path: Optional[str] = None,
+        **kwargs,
+    ) -> Future:
+        """Starts synthesizing ``text`` in a background thread. A later call to
+        :meth:`generate_from_text` with the same arguments waits for this
+        result instead of sending a new request.
+
+        Args:
+            text (str): The text to synthesize speech from.
+            cache_dir (str, optional): The output directory. Defaults to None.
+            path (str, optional): The path to save the audio file to. Defaults to None.
+
+        Returns:
+            Future: A future resolving to the output data dictionary.
+        """
+        if kwargs.get("text_id") is not None:
+            raise ValueError(
+                "`text_id` depends on the order of the voiceovers and cannot be prefetched."
+            )
+
+        # Same normalization as SpeechService._wrap_generate_from_text()
+        text = " ".join(text.split())
+        key = self._prefetch_key(text, cache_dir, path, kwargs)
+        future = self._prefetched.get(key)
+        if future is None:
+            future = self._executor.submit(
+                self._generate_from_text, text, cache_dir, path, **kwargs
+            )
+            self._prefetched[key] = future
+        return future
 
     def generate_from_text(
         self,
         text: str,
         cache_dir: Optional[str] = None,
         path: Optional[str] = None,
+        **kwargs,
+    ) -> dict:
+        future = self._prefetched.pop(
+            self._prefetch_key(text, cache_dir, path, kwargs), None
+        )
+        if future is not None:
+            return future.result()
+
+        return self._generate_from_text(text, cache_dir, path, **kwargs)
+
+    def _generate_from_text(
+        self,
+        text: str,
+        cache_dir: Optional[str] = None,
+        path: Optional[str] = None,
+        **kwargs,
+    ) -> dict:
+        if cache_dir is None:
+            cache_dir = self.cache_dir  # type: ignore
+
+        self._ensure_voice()
+
+        json_dict, request_kwargs = self._prepare_request(text, cache_dir, path, **kwargs)
+        if request_kwargs is None:
+            return json_dict
+
+        input_text = json_dict["input_data"]["input_text"]
+        try:
+            sentences = []
+            if len(input_text) > SENTENCE_SPLIT_MIN_LENGTH and (
+                self.output_format.startswith("mp3_")
+                or self.output_format.startswith("pcm_")
+            ):
+                sentences = _split_sentences(input_text)
+
+            full_audio_path = Path(cache_dir) / json_dict["original_audio"]
+            if len(sentences) > 1:
+                # Each sentence request is retried on its own
+                self._write_audio(
+                    self._synthesize_sentences(sentences, **request_kwargs),
+                    full_audio_path,
+                )
+            else:
+                # A failed stream is restarted from the beginning, which
+                # rewrites the file
+                _with_retries(
+                    lambda: self._write_audio(
+                        self._synthesize(input_text, **request_kwargs),
+                        full_audio_path,
+                    )
+                )
+
+        except Exception as e:
+            logger.error(f"ElevenLabs TTS failed: {e}")
+            raise Exception(f"Failed to generate speech: {e}")
+
+        return json_dict
+
+    async def agenerate_from_text(
+        self,
+        text: str,
+        cache_dir: Optional[str] = None,
+        path: Optional[str] = None,
+        **kwargs,
+    ) -> dict:
+        """Asynchronous version of :meth:`generate_from_text`, using the
+        ElevenLabs async client. Use :meth:`agenerate_many` to synthesize
+        several texts concurrently over a shared connection pool.
+
+        Args:
+            text (str): The text to synthesize speech from.
+            cache_dir (str, optional): The output directory. Defaults to None.
+            path (str, optional): The path to save the audio file to. Defaults to None.
+
+        Returns:
+            dict: Output data dictionary.
+        """
+        async with _open_async_client(self._api_key) as aclient:
+            return await self._agenerate_from_text(
+                aclient, text, cache_dir, path, **kwargs
+            )
+
+    async def agenerate_many(self, texts: List[str], **kwargs) -> List[dict]:
+        """Synthesizes all the given texts concurrently on a single thread,
+        sharing one async client that is closed once they are done.
+
+        Args:
+            texts (List[str]): The texts to synthesize speech from.
+
+        Returns:
+            List[dict]: The output data dictionaries, in the order of `texts`.
+        """
+        # Repeated texts are synthesized once and share the result
+        texts = [" ".join(text.split()) for text in texts]
+        unique_texts = list(dict.fromkeys(texts))
+        async with _open_async_client(self._api_key) as aclient:
+            results = await asyncio.gather(
+                *[
+                    self._agenerate_from_text(aclient, text, **kwargs)
+                    for text in unique_texts
+                ]
+            )
+        results_by_text = dict(zip(unique_texts, results))
+        return [results_by_text[text] for text in texts]
+
+    async def _agenerate_from_text(
+        self,
+        aclient: "AsyncElevenLabs",
+        text: str,
+        cache_dir: Optional[str] = None,
+        path: Optional[str] = None,
+        **kwargs,
+    ) -> dict:
+        if kwargs.get("text_id") is not None:
+            raise ValueError(
+                "`text_id` depends on the order of the voiceovers and cannot be "
+                "used with concurrent generation."
+            )
+
+        if cache_dir is None:
+            cache_dir = self.cache_dir  # type: ignore
+
+        text = " ".join(text.split())
+        if not self._voice_resolved:
+            await asyncio.wrap_future(self._voice_future)
+            self._voice_resolved = True
+
+        json_dict, request_kwargs = self._prepare_request(text, cache_dir, path, **kwargs)
+        if request_kwargs is None:
+            return json_dict
+
+        try:
+            async def stream_to_file():
+                audio = aclient.text_to_speech.stream(
+                    text=json_dict["input_data"]["input_text"],
+                    voice_id=self.voice_id,
+                    model_id=self.model,
+                    output_format=self.output_format,
+                    **request_kwargs,
+                )
+                with self._open_audio_file(
+                    Path(cache_dir) / json_dict["original_audio"]
+                ) as write:
+                    async for chunk in audio:
+                        if chunk:
+                            write(chunk)
+
+            await _async_with_retries(stream_to_file)
+
+        except Exception as e:
+            logger.error(f"ElevenLabs TTS failed: {e}")
+            raise Exception(f"Failed to generate speech: {e}")
+
+        return json_dict
+
+    def _prepare_request(
+        self,
+        text: str,
+        cache_dir: str,
+        path: Optional[str] = None,
         # Per-request overrides
         voice_settings: Optional[VoiceSettings] = None,
         enable_logging: Optional[bool] = None,
@@ -177,10 +883,9 @@ class ElevenLabsService(SpeechService):
         apply_text_normalization: Optional[str] = None,
         apply_language_text_normalization: Optional[bool] = None,
         **kwargs,
-    ) -> dict:
-        if cache_dir is None:
-            cache_dir = self.cache_dir  # type: ignore
-
+    ) -> Tuple[dict, Optional[dict]]:
+        # Returns the output data and the arguments for the TTS request, or
+        # None instead of the latter if the audio is already cached
         input_text = remove_bookmarks(text)
         
         # Extract text_id from kwargs for consecutive text tracking
@@ -206,6 +911,7 @@ class ElevenLabsService(SpeechService):
         final_enable_logging = enable_logging if enable_logging is not None else self.enable_logging
         final_optimize_streaming_latency = optimize_streaming_latency if optimize_streaming_latency is not None else self.optimize_streaming_latency
         final_language_code = language_code or self.language_code
+        _validate_language_code(final_language_code, self.model)
         final_apply_text_normalization = apply_text_normalization or self.apply_text_normalization
         final_apply_language_text_normalization = apply_language_text_normalization if apply_language_text_normalization is not None else self.apply_language_text_normalization
 
@@ -231,51 +937,59 @@ class ElevenLabsService(SpeechService):
             },
         }
 
-        # Check cache
-        cached_result = self.get_cached_result(input_data, cache_dir)
+        json_dict = {
+            "input_text": text,
+            "input_data": input_data,
+        }
+
+        # cache.json holds the full result of earlier generations, including
+        # word boundaries, so it is checked first
+        cached_result = self.get_cached_result(input_data, Path(cache_dir))
         if cached_result is not None:
-            return cached_result
+            return cached_result, None
 
+        # Audio files are named after the hash of everything that affects the
+        # audio, so audio generated without a cache.json entry (e.g. by
+        # agenerate_from_text) is reused without calling the API again
         if path is None:
-            audio_path = self.get_audio_basename(input_data) + ".mp3"
+            default_config = all(
+                v is None
+                for v in (
+                    voice_settings,
+                    enable_logging,
+                    optimize_streaming_latency,
+                    language_code,
+                    seed,
+                    previous_text,
+                    next_text,
+                    previous_request_ids,
+                    next_request_ids,
+                    apply_text_normalization,
+                    apply_language_text_normalization,
+                )
+            )
+            audio_path = (
+                self._cache_key(input_data, default_config=default_config)
+                + self._audio_extension()
+            )
+            if (Path(cache_dir) / audio_path).exists():
+                json_dict["original_audio"] = audio_path
+                return json_dict, None
         else:
             audio_path = path
 
-        try:
-            # Use the new client API for text-to-speech with all available parameters
-            # Use per-request overrides if provided, otherwise use instance defaults
-            audio = self.client.text_to_speech.convert(
-                text=input_text,
-                voice_id=self.voice_id,
-                model_id=self.model,
-                output_format=self.output_format,
-                voice_settings=final_voice_settings,
-                enable_logging=final_enable_logging,
-                optimize_streaming_latency=final_optimize_streaming_latency,
-                language_code=final_language_code,
-                seed=seed,
-                previous_text=previous_text,
-                next_text=next_text,
-                previous_request_ids=previous_request_ids,
-                next_request_ids=next_request_ids,
-                apply_text_normalization=final_apply_text_normalization,
-                apply_language_text_normalization=final_apply_language_text_normalization,
-            )
-            
-            # Save the audio to file using the correct path
-            if cache_dir is None:
-                raise ValueError("cache_dir cannot be None")
-            full_audio_path = Path(cache_dir) / audio_path
-            save(audio, str(full_audio_path))
-            
-        except Exception as e:
-            logger.error(f"ElevenLabs TTS failed: {e}")
-            raise Exception(f"Failed to generate speech: {e}")
-
-        json_dict = {
-            "input_text": text,
-            "input_data": input_data,
-            "original_audio": audio_path,
-        }
-
-        return json_dict
+        json_dict["original_audio"] = audio_path
+        request_kwargs = dict(
+            voice_settings=final_voice_settings,
+            enable_logging=final_enable_logging,
+            optimize_streaming_latency=final_optimize_streaming_latency,
+            language_code=final_language_code,
+            seed=seed,
+            previous_text=previous_text,
+            next_text=next_text,
+            previous_request_ids=previous_request_ids,
+            next_request_ids=next_request_ids,
+            apply_text_normalization=final_apply_text_normalization,
+            apply_language_text_normalization=final_apply_language_text_normalization,
+        )
+        return json_dict, request_kwargs
@@ -1,3 +1,4 @@
+import asyncio
 from math import ceil
 from contextlib import contextmanager
 from pathlib import Path
@@ -42,6 +43,56 @@ class VoiceoverScene(Scene):
         else:
             self.create_subcaption = create_subcaption
 
+    def prefetch_voiceovers(self, texts: t.List[str], **kwargs) -> None:
+        """Starts synthesizing the given voiceover texts in the background, so
+        that the corresponding `voiceover` calls don't have to wait for the
+        speech service. Has no effect if the speech service does not support
+        background synthesis.
+
+        Args:
+            texts (List[str]): The texts of the upcoming voiceovers.
+        """
+        if not hasattr(self, "speech_service"):
+            raise Exception(
+                "You need to call init_voiceover() before adding a voiceover."
+            )
+
+        generate_async = getattr(self.speech_service, "generate_from_text_async", None)
+        if generate_async is None:
+            return
+
+        for text in texts:
+            generate_async(text, **kwargs)
+
+    def render_voiceovers_async(self, texts: t.List[str], **kwargs) -> None:
+        """Synthesizes all the given voiceover texts concurrently on a single
+        thread and waits until they are done, so that the corresponding
+        `voiceover` calls are served from the cache. This scales better than
+        `prefetch_voiceovers` for a large number of texts. Falls back to
+        `prefetch_voiceovers` if the speech service has no asynchronous API
+        or an event loop is already running, e.g. in Jupyter.
+
+        Args:
+            texts (List[str]): The texts of the upcoming voiceovers.
+        """
+        if not hasattr(self, "speech_service"):
+            raise Exception(
+                "You need to call init_voiceover() before adding a voiceover."
+            )
+
+        agenerate_many = getattr(self.speech_service, "agenerate_many", None)
+        try:
+            asyncio.get_running_loop()
+            loop_running = True
+        except RuntimeError:
+            loop_running = False
+
+        if agenerate_many is None or loop_running:
+            self.prefetch_voiceovers(texts, **kwargs)
+            return
+
+        asyncio.run(agenerate_many(texts, **kwargs))
+
     def add_voiceover_text(
         self,
         text: str,
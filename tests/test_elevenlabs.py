@@ -0,0 +1,232 @@
+import asyncio
+import multiprocessing
+import os
+import pickle
+import threading
+import types
+
+import pytest
+
+pytest.importorskip("manim")
+pytest.importorskip("elevenlabs")
+
+import httpx
+from elevenlabs.core.api_error import ApiError
+
+from manim_voiceover_fixed.helper import append_to_json_file
+from manim_voiceover_fixed.services import elevenlabs
+from manim_voiceover_fixed.services.elevenlabs import (
+    ElevenLabsService,
+    _retriable,
+    _split_at_word_boundaries,
+    _split_sentences,
+)
+
+
+@pytest.fixture
+def service(monkeypatch, tmp_path):
+    monkeypatch.setenv("ELEVEN_API_KEY", "test-key")
+    return ElevenLabsService(
+        voice_id="test-voice",
+        enable_logging=True,
+        transcription_model=None,
+        cache_dir=str(tmp_path),
+    )
+
+
+def _use_stream(service, stream):
+    service.client = types.SimpleNamespace(
+        text_to_speech=types.SimpleNamespace(stream=stream)
+    )
+
+
+def test_split_sentences():
+    assert _split_sentences("This is first. This is second. This is third.") == [
+        "This is first.",
+        "This is second.",
+        "This is third.",
+    ]
+
+
+def test_split_sentences_keeps_abbreviations_and_decimals():
+    assert _split_sentences("Mr. Smith has 3.14 apples. Dr. Who has none.") == [
+        "Mr. Smith has 3.14 apples.",
+        "Dr. Who has none.",
+    ]
+
+
+def test_split_sentences_merges_short_sentences():
+    assert _split_sentences("This is first. This is second. Ok.") == [
+        "This is first.",
+        "This is second. Ok.",
+    ]
+    assert _split_sentences("Ok. What happened next was surprising! Is it true?") == [
+        "Ok. What happened next was surprising!",
+        "Is it true?",
+    ]
+
+
+def test_split_at_word_boundaries():
+    chunks = list(_split_at_word_boundaries(["Hel", "lo wor", "ld. How", " are\nyou", ""]))
+    assert chunks == ["Hello ", "world. ", "How are ", "you "]
+
+
+def test_cache_key_is_stable_across_overrides(service):
+    default, _ = service._prepare_request("Hello world.", service.cache_dir)
+    same, _ = service._prepare_request(
+        "Hello world.", service.cache_dir, enable_logging=True
+    )
+    different, _ = service._prepare_request(
+        "Hello world.", service.cache_dir, enable_logging=False
+    )
+    assert default["original_audio"] == same["original_audio"]
+    assert default["original_audio"] != different["original_audio"]
+
+
+def test_pickle_round_trip(service):
+    restored = pickle.loads(pickle.dumps(service))
+    assert restored.voice_id == "test-voice"
+    assert restored.client is elevenlabs._get_client("test-key")
+    assert restored._executor.submit(lambda: 1).result() == 1
+    assert "_api_key" not in service.__getstate__()
+
+
+def _report_client(queue, parent_client):
+    queue.put(elevenlabs._get_client("test-key") is not parent_client)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork")
+def test_forked_child_gets_its_own_client(service):
+    ctx = multiprocessing.get_context("fork")
+    queue = ctx.Queue()
+    process = ctx.Process(target=_report_client, args=(queue, service.client))
+    process.start()
+    assert queue.get(timeout=30)
+    process.join()
+    assert elevenlabs._get_client("test-key") is service.client
+
+
+def test_retriable():
+    assert _retriable(ApiError(status_code=429))
+    assert _retriable(ApiError(status_code=503))
+    assert _retriable(httpx.ConnectError("connection refused"))
+    assert not _retriable(ApiError(status_code=401))
+    assert not _retriable(ValueError())
+
+
+def test_overlapping_writes_to_the_same_file(service, tmp_path):
+    first_started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def stream(text, **kwargs):
+        calls.append(text)
+        if len(calls) == 1:
+            first_started.set()
+            release.wait(10)
+        yield b"audio"
+
+    _use_stream(service, stream)
+    # The override equals the default, so both calls write the same file
+    future = service.generate_from_text_async("Thank you for watching.")
+    assert first_started.wait(10)
+    result = service.generate_from_text(
+        "Thank you for watching.", enable_logging=True
+    )
+    release.set()
+
+    assert future.result()["original_audio"] == result["original_audio"]
+    assert (tmp_path / result["original_audio"]).read_bytes() == b"audio"
+    assert not list(tmp_path.glob("*.part"))
+
+
+def test_failed_download_leaves_no_files(service, tmp_path):
+    def stream(text, **kwargs):
+        yield b"partial"
+        raise ValueError("stream interrupted")
+
+    _use_stream(service, stream)
+    with pytest.raises(Exception, match="stream interrupted"):
+        service.generate_from_text("Hello world.")
+    assert not list(tmp_path.iterdir())
+
+
+def test_cache_json_entry_is_preferred(service, tmp_path):
+    def stream(text, **kwargs):
+        raise AssertionError("the API must not be called")
+
+    _use_stream(service, stream)
+    entry, _ = service._prepare_request("Hello world.", service.cache_dir)
+    entry["word_boundaries"] = [{"text": "Hello", "text_offset": 0}]
+    append_to_json_file(str(tmp_path / "cache.json"), entry)
+    (tmp_path / entry["original_audio"]).write_bytes(b"audio")
+
+    assert service.generate_from_text("Hello world.") == entry
+
+
+def test_agenerate_many(service, tmp_path, monkeypatch):
+    calls = []
+    clients = []
+
+    async def stream(text, **kwargs):
+        calls.append(text)
+        await asyncio.sleep(0)
+        yield text.encode()
+
+    class FakeAsyncElevenLabs:
+        def __init__(self, api_key, httpx_client):
+            clients.append(httpx_client)
+            self.text_to_speech = types.SimpleNamespace(stream=stream)
+
+    monkeypatch.setattr(elevenlabs, "AsyncElevenLabs", FakeAsyncElevenLabs)
+    texts = ["First text.", "Second text.", "First  text.", "First text."]
+    results = asyncio.run(service.agenerate_many(texts))
+
+    assert sorted(calls) == ["First text.", "Second text."]
+    assert [r["input_text"] for r in results] == [
+        "First text.",
+        "Second text.",
+        "First text.",
+        "First text.",
+    ]
+    assert (tmp_path / results[0]["original_audio"]).read_bytes() == b"First text."
+    assert (tmp_path / results[1]["original_audio"]).read_bytes() == b"Second text."
+    assert len(clients) == 1 and clients[0].is_closed
+
+
+def test_pcm_output_is_written_as_wav(monkeypatch, tmp_path):
+    from manim_voiceover_fixed.modify_audio import get_duration
+
+    monkeypatch.setenv("ELEVEN_API_KEY", "test-key")
+    service = ElevenLabsService(
+        voice_id="test-voice",
+        output_format="pcm_24000",
+        transcription_model=None,
+        cache_dir=str(tmp_path),
+    )
+
+    def stream(text, **kwargs):
+        # One second of 16-bit mono samples at 24 kHz
+        yield b"\0" * 24000
+        yield b"\0" * 24000
+
+    _use_stream(service, stream)
+    result = service.generate_from_text("Hello world.")
+
+    assert result["original_audio"].endswith(".wav")
+    assert get_duration(tmp_path / result["original_audio"]) == 1.0
+
+
+def test_generate_from_text_reuses_prefetched_result(service):
+    calls = []
+
+    def stream(text, **kwargs):
+        calls.append(text)
+        yield b"audio"
+
+    _use_stream(service, stream)
+    future = service.generate_from_text_async("Hello   world.")
+    result = service.generate_from_text("Hello world.")
+
+    assert result is future.result()
+    assert calls == ["Hello world."]
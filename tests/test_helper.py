@@ -0,0 +1,37 @@
+import json
+import threading
+
+import pytest
+
+pytest.importorskip("manim")
+
+from manim_voiceover_fixed.helper import append_to_json_file
+
+
+def test_append_to_json_file_is_atomic(tmp_path):
+    json_file = str(tmp_path / "cache.json")
+    append_to_json_file(json_file, {"i": 0})
+    done = threading.Event()
+    errors = []
+
+    def read():
+        while not done.is_set():
+            try:
+                with open(json_file) as f:
+                    json.load(f)
+            except ValueError as e:
+                errors.append(e)
+
+    reader = threading.Thread(target=read)
+    reader.start()
+    try:
+        for i in range(1, 200):
+            append_to_json_file(json_file, {"i": i})
+    finally:
+        done.set()
+        reader.join()
+
+    assert not errors
+    with open(json_file) as f:
+        assert [entry["i"] for entry in json.load(f)] == list(range(200))
+    assert [p.name for p in tmp_path.iterdir()] == ["cache.json"]